@@ -11,10 +11,48 @@ It's a quick way to generate sample images in different formats.
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+# Spare images kept around for reuse, so every test image doesn't need a fresh buffer
+IMAGE_POOL_SIZE = 4
+_image_pool = []
+
+# Fonts loaded so far, keyed by (name, size)
+_FONT_CACHE = {}
+
+def get_font(name=None, size=None):
+    """Load a font once and reuse it, falling back to PIL's default font."""
+    key = (name, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        if name is not None:
+            try:
+                font = ImageFont.truetype(name, size)
+            except IOError:
+                pass
+        if font is None:
+            font = ImageFont.load_default()
+        _FONT_CACHE[key] = font
+    return font
+
+def new_image(mode, size, color):
+    """Get an image filled with the given color, reusing a pooled one if possible."""
+    for i, img in enumerate(_image_pool):
+        if img.mode == mode and img.size == size:
+            img = _image_pool.pop(i)
+            # Clear the old contents
+            img.paste(color, (0, 0) + size)
+            return img
+    return Image.new(mode, size, color=color)
+
+def release_image(img):
+    """Put an image back into the pool once it has been saved."""
+    _image_pool.append(img)
+    if len(_image_pool) > IMAGE_POOL_SIZE:
+        _image_pool.pop(0)
+
 def create_test_image(filename="test_image.png", width=800, height=600):
     """Create a simple test image with some shapes and text."""
     # Create a new image with a blue background
-    img = Image.new('RGB', (width, height), color=(73, 109, 137))
+    img = new_image('RGB', (width, height), (73, 109, 137))
     
     # Create a drawing object
     d = ImageDraw.Draw(img)
@@ -27,18 +65,15 @@ def create_test_image(filename="test_image.png", width=800, height=600):
     d.ellipse([(width//3, height//3), (width*2//3, height*2//3)], 
               fill=(0, 255, 0), outline=(0, 0, 255), width=5)
     
-    # Add some text
-    try:
-        # Try to load a font, use default if not available
-        font = ImageFont.truetype("arial.ttf", 36)
-    except IOError:
-        font = ImageFont.load_default()
+    # Add some text (uses the default font if Arial isn't available)
+    font = get_font("arial.ttf", 36)
     
     d.text((width//2, height//5), "ImageConverter Test Image", 
            fill=(255, 255, 0), font=font, anchor="mm")
     
     # Save the image
     img.save(filename)
+    release_image(img)
     print(f"Test image created: {filename}")
     
     return filename
@@ -62,27 +97,30 @@ def create_test_images_folder(folder_name="test_images", count=5):
     ]
     
     created_files = []
+    font = get_font()
     
     # Create images in the main folder
     for i in range(count):
         for ext, format_name in formats:
             filename = os.path.join(folder_name, f"test_image_{i+1}.{ext}")
-            img = Image.new('RGB', (400, 300), color=(73, 109, 137))
+            img = new_image('RGB', (400, 300), (73, 109, 137))
             d = ImageDraw.Draw(img)
             d.text((200, 150), f"Test Image {i+1} - {format_name}", 
-                   fill=(255, 255, 0), anchor="mm")
+                   fill=(255, 255, 0), font=font, anchor="mm")
             img.save(filename, format=format_name)
+            release_image(img)
             created_files.append(filename)
     
     # Create images in the subfolder
     for i in range(2):
         for ext, format_name in formats[:2]:  # Only JPG and PNG in subfolder
             filename = os.path.join(subfolder, f"subtest_image_{i+1}.{ext}")
-            img = Image.new('RGB', (400, 300), color=(137, 73, 109))
+            img = new_image('RGB', (400, 300), (137, 73, 109))
             d = ImageDraw.Draw(img)
             d.text((200, 150), f"Subfolder Test {i+1} - {format_name}", 
-                   fill=(0, 255, 255), anchor="mm")
+                   fill=(0, 255, 255), font=font, anchor="mm")
             img.save(filename, format=format_name)
+            release_image(img)
             created_files.append(filename)
     
     print(f"Created {len(created_files)} test images in '{folder_name}' folder.")
@@ -12,8 +12,10 @@ import os
 import sys
 import argparse
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Union
+from typing import List, Tuple, Optional, Dict, Union, Iterator
 
 try:
     from PIL import Image
@@ -24,6 +26,13 @@ except ImportError:
     print("pip install -r requirements.txt")
     sys.exit(1)
 
+# Optional: libjpeg-turbo encoder for faster JPEG output
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_GRAY, TJSAMP_420, TJSAMP_GRAY
+except ImportError:
+    TurboJPEG = None
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -38,6 +47,44 @@ SUPPORTED_FORMATS = {
     'gif': 'GIF'
 }
 
+# File extension for each PIL format (reversed, so JPEG maps to 'jpg' rather than 'jpeg')
+_FORMAT_TO_EXT = {fmt: ext for ext, fmt in reversed(SUPPORTED_FORMATS.items())}
+
+# Resampling filters available for resizing
+RESIZE_FILTERS = {
+    'lanczos': Image.LANCZOS,
+    'bicubic': Image.BICUBIC,
+    'bilinear': Image.BILINEAR,
+    'nearest': Image.NEAREST
+}
+
+# Processing backends: PIL (default) or libvips (optional, for huge images)
+BACKENDS = ['pil', 'vips']
+
+# libvips saver for each output format (BMP isn't supported, so it always goes through PIL)
+VIPS_SAVERS = {
+    'JPEG': 'jpegsave',
+    'PNG': 'pngsave',
+    'WEBP': 'webpsave',
+    'TIFF': 'tiffsave',
+    'GIF': 'gifsave'
+}
+
+# File extensions picked up when scanning a directory
+IMAGE_EXTENSIONS = frozenset(SUPPORTED_FORMATS)
+
+# Read buffer size used when opening input images (1 MiB)
+READ_BUFFER_SIZE = 1 << 20
+
+# Per-process TurboJPEG state (created lazily, reused for every image)
+_turbo_jpeg = None
+_turbo_jpeg_failed = False
+_jpeg_scratch = bytearray()
+
+# Per-process pool of spare image buffers, reused across images of the same mode and size
+IMAGE_POOL_SIZE = 4
+_image_pool: List[Image.Image] = []
+
 def print_banner():
     """Display the program banner."""
     banner = f"""
@@ -62,12 +109,38 @@ def print_banner():
     print(f"{Fore.CYAN}License: {Fore.WHITE}MIT")
     print()
 
+def _format_list_type(value: str) -> List[str]:
+    """Parse a comma-separated list of output formats (e.g. 'jpg,png,webp')."""
+    formats = [fmt.strip().lower() for fmt in value.split(',') if fmt.strip()]
+    if not formats:
+        raise argparse.ArgumentTypeError("at least one output format is required")
+    for fmt in formats:
+        if fmt not in SUPPORTED_FORMATS:
+            raise argparse.ArgumentTypeError(
+                f"invalid format: '{fmt}' (choose from {', '.join(SUPPORTED_FORMATS)})")
+    return formats
+
+def _int_range_type(low: int, high: int):
+    """Build an argparse type that accepts integers between low and high (inclusive)."""
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+        if not low <= number <= high:
+            raise argparse.ArgumentTypeError(f"must be between {low} and {high}, got {number}")
+        return number
+    return parse
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         description="A tool for converting images between different formats",
-        formatter_class=argparse.RawDescriptionHelpFormatter
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        # -h is taken by --height, so help is only available as --help
+        add_help=False
     )
+    parser.add_argument('--help', action='help', help='Show this help message and exit')
     
     input_group = parser.add_mutually_exclusive_group(required=True)
     input_group.add_argument('-i', '--input', type=str, help='Input image file')
@@ -75,9 +148,9 @@ def parse_arguments() -> argparse.Namespace:
     
     parser.add_argument('-o', '--output', type=str, required=True, 
                         help='Output file or directory')
-    parser.add_argument('-t', '--type', type=str, choices=list(SUPPORTED_FORMATS.keys()),
-                        help='Output format')
-    parser.add_argument('-q', '--quality', type=int, choices=range(1, 101), default=90,
+    parser.add_argument('-t', '--type', type=_format_list_type,
+                        help='Output format, or a comma-separated list of formats for a directory')
+    parser.add_argument('-q', '--quality', type=_int_range_type(1, 100), default=90,
                         help='Image quality (1-100, only for JPG and WebP)')
     parser.add_argument('-w', '--width', type=int, help='Output width')
     parser.add_argument('-h', '--height', type=int, help='Output height')
@@ -85,6 +158,14 @@ def parse_arguments() -> argparse.Namespace:
                         help='Search recursively in subdirectories')
     parser.add_argument('-g', '--grayscale', action='store_true',
                         help='Convert to grayscale')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Search for the smallest PNG encoding (much slower)')
+    parser.add_argument('--compress-level', type=_int_range_type(0, 9), default=6,
+                        help='PNG compression level (0-9, default 6)')
+    parser.add_argument('--filter', type=str, choices=list(RESIZE_FILTERS.keys()),
+                        help='Resize filter (default: lanczos when shrinking, bicubic when enlarging)')
+    parser.add_argument('--backend', type=str, choices=BACKENDS, default='pil',
+                        help='Image library to use (vips needs pyvips and streams huge images with little memory)')
     
     return parser.parse_args()
 
@@ -100,69 +181,369 @@ def get_output_format(output_path: str, specified_type: Optional[str] = None) ->
     # Default format if not recognized
     return 'JPEG'
 
-def process_image(
-    input_path: str, 
-    output_path: str, 
+def _acquire_image(mode: str, size: Tuple[int, int]) -> Image.Image:
+    """Take a buffer with the given mode and size from the pool, or allocate a new one."""
+    for i, img in enumerate(_image_pool):
+        if img.mode == mode and img.size == size:
+            return _image_pool.pop(i)
+    return Image.new(mode, size)
+
+def _release_image(img: Image.Image) -> None:
+    """Return a buffer to the pool, dropping the oldest one if the pool is full."""
+    _image_pool.append(img)
+    if len(_image_pool) > IMAGE_POOL_SIZE:
+        _image_pool.pop(0)
+
+def _get_turbo_jpeg() -> Optional["TurboJPEG"]:
+    """Return this process's TurboJPEG instance, or None if it isn't available."""
+    global _turbo_jpeg, _turbo_jpeg_failed
+    if _turbo_jpeg is None and TurboJPEG is not None and not _turbo_jpeg_failed:
+        try:
+            _turbo_jpeg = TurboJPEG()
+        except (OSError, RuntimeError):
+            # The Python package is installed but the shared library isn't
+            _turbo_jpeg_failed = True
+    return _turbo_jpeg
+
+def _save_jpeg_turbo(img: Image.Image, output_path: str, quality: int) -> bool:
+    """
+    Encode a JPEG with libjpeg-turbo into a reused scratch buffer.
+    
+    Returns:
+        bool: Whether the image was saved (False means fall back to PIL)
+    """
+    global _jpeg_scratch
+    jpeg = _get_turbo_jpeg()
+    if jpeg is None or img.mode not in ('RGB', 'L'):
+        return False
+    
+    arr = np.asarray(img)
+    if img.mode == 'L':
+        arr = arr.reshape(arr.shape[0], arr.shape[1], 1)
+        pixel_format, subsample = TJPF_GRAY, TJSAMP_GRAY
+    else:
+        pixel_format, subsample = TJPF_RGB, TJSAMP_420
+    
+    # Only grow the buffer when a bigger image comes along
+    buffer_size = jpeg.buffer_size(arr, subsample)
+    if len(_jpeg_scratch) < buffer_size:
+        _jpeg_scratch = bytearray(buffer_size)
+    
+    _, n_bytes = jpeg.encode(arr, quality=quality, pixel_format=pixel_format,
+                             jpeg_subsample=subsample, dst=_jpeg_scratch)
+    with open(output_path, 'wb') as f:
+        f.write(memoryview(_jpeg_scratch)[:n_bytes])
+    return True
+
+def calculate_size(
+    src_width: int, 
+    src_height: int, 
+    width: Optional[int], 
+    height: Optional[int]
+) -> Tuple[int, int]:
+    """
+    Calculate the output size, filling in a missing dimension proportionally.
+    
+    Args:
+        src_width: Width of the source image
+        src_height: Height of the source image
+        width: Requested width (optional)
+        height: Requested height (optional)
+        
+    Returns:
+        Tuple[int, int]: (width, height)
+    """
+    # Integer math, so there are no float rounding surprises
+    if width and not height:
+        height = src_height * width // src_width
+    elif height and not width:
+        width = src_width * height // src_height
+    return width, height
+
+def get_save_kwargs(
     output_format: str, 
     quality: int = 90, 
+    optimize: bool = False, 
+    compress_level: int = 6
+) -> Dict[str, Union[int, bool]]:
+    """
+    Build the PIL save options for an output format.
+    
+    Args:
+        output_format: Output format (PIL format name)
+        quality: Image quality (1-100)
+        optimize: Search for the smallest PNG encoding
+        compress_level: PNG compression level (0-9)
+        
+    Returns:
+        Dict[str, Union[int, bool]]: Keyword arguments for Image.save
+    """
+    save_kwargs = {}
+    if output_format in ['JPEG', 'WEBP']:
+        save_kwargs['quality'] = quality
+    if output_format == 'PNG':
+        save_kwargs['compress_level'] = compress_level
+        if optimize:
+            save_kwargs['optimize'] = True
+    return save_kwargs
+
+def save_image(
+    img: Image.Image, 
+    output_path: str, 
+    output_format: str, 
+    save_kwargs: Dict[str, Union[int, bool]]
+) -> bool:
+    """
+    Save an already loaded image in the given format.
+    
+    Args:
+        img: The image to save
+        output_path: Path to save the output image (its directory must already exist)
+        output_format: Output format (PIL format name)
+        save_kwargs: Save options from get_save_kwargs()
+        
+    Returns:
+        bool: Whether the image was saved successfully
+    """
+    try:
+        if img.mode == 'RGBA' and output_format == 'JPEG':
+            # JPEG doesn't support transparency, convert to RGB
+            img = img.convert('RGB')
+        
+        if output_format == 'JPEG' and _save_jpeg_turbo(img, output_path, save_kwargs['quality']):
+            return True
+        
+        img.save(output_path, format=output_format, **save_kwargs)
+        return True
+    
+    except Exception as e:
+        print(f"{Fore.RED}Error saving image ({output_path}): {e}")
+        return False
+
+def convert_image_vips(
+    input_path: str, 
+    outputs: List[Tuple[str, str, Dict]], 
     width: Optional[int] = None, 
     height: Optional[int] = None, 
     grayscale: bool = False
-) -> bool:
+) -> Optional[int]:
     """
-    Process an image with the given parameters.
+    Convert an image with libvips.
+    
+    The image is streamed through in strips instead of being decoded into memory
+    all at once, so peak memory stays low even for huge images. Resizing always
+    uses libvips' LANCZOS3 thumbnailer, and PNG 'optimize' isn't supported.
     
     Args:
         input_path: Path to the input image
-        output_path: Path to save the output image
-        output_format: Output format (PIL format name)
-        quality: Image quality (1-100)
+        outputs: List of (output path, PIL format name, save options), all formats in VIPS_SAVERS
         width: Output width (optional)
         height: Output height (optional)
         grayscale: Convert to grayscale
         
     Returns:
-        bool: Whether the conversion was successful
+        Optional[int]: Number of outputs saved successfully, or None if libvips
+        isn't available or can't read the input (e.g. BMP)
     """
+    # Imported here so the PIL backend never pays for loading libvips
+    try:
+        import pyvips
+    except (ImportError, OSError):
+        return None
+    
+    # Formats libvips can't read (e.g. BMP) fall back to PIL
     try:
-        # Load the image
-        img = Image.open(input_path)
+        img = pyvips.Image.new_from_file(input_path, access='sequential')
+    except pyvips.Error:
+        return None
+    
+    try:
+        # Resize if needed
+        if width or height:
+            width, height = calculate_size(img.width, img.height, width, height)
+            if (width, height) != (img.width, img.height):
+                img = img.thumbnail_image(width, height=height, size='force')
         
-        # Color mode conversion if needed
         if grayscale:
-            img = img.convert('L')
-        elif img.mode == 'RGBA' and output_format == 'JPEG':
-            # JPEG doesn't support transparency, convert to RGB
-            img = img.convert('RGB')
+            # Drop alpha the way PIL does (libvips would flatten it onto black instead)
+            if img.hasalpha():
+                img = img.extract_band(0, n=img.bands - 1)
+            if img.format == 'uchar' and img.bands == 3:
+                # Same ITU-R 601 luma as PIL's convert('L'), rather than libvips' b-w
+                img = (img.recomb([[0.299, 0.587, 0.114]]) + 0.5).cast('uchar')
+                img = img.copy(interpretation='b-w')
+            else:
+                img = img.colourspace('b-w')
         
-        # Resize if needed
-        if width or height:
-            # If only one dimension is specified, calculate the other proportionally
-            if width and not height:
-                wpercent = width / float(img.size[0])
-                height = int(float(img.size[1]) * float(wpercent))
-            elif height and not width:
-                hpercent = height / float(img.size[1])
-                width = int(float(img.size[0]) * float(hpercent))
+        # A sequential image can only be read once, so keep the result in memory
+        # when it has to be saved more than once
+        if len(outputs) > 1:
+            img = img.copy_memory()
+        
+        saved = 0
+        for output_path, output_format, save_kwargs in outputs:
+            # Same options, under libvips' names
+            vips_kwargs = {}
+            if 'quality' in save_kwargs:
+                vips_kwargs['Q'] = save_kwargs['quality']
+            if 'compress_level' in save_kwargs:
+                vips_kwargs['compression'] = save_kwargs['compress_level']
             
-            img = img.resize((width, height), Image.LANCZOS)
+            # JPEG doesn't support transparency, so just drop the alpha band
+            out = img
+            if output_format == 'JPEG' and out.hasalpha():
+                out = out.extract_band(0, n=out.bands - 1)
+            
+            try:
+                getattr(out, VIPS_SAVERS[output_format])(output_path, **vips_kwargs)
+                saved += 1
+            except pyvips.Error as e:
+                print(f"{Fore.RED}Error saving image ({output_path}): {e}")
+        return saved
+    
+    except Exception as e:
+        print(f"{Fore.RED}Error processing image ({input_path}): {e}")
+        return 0
+
+def convert_image(
+    input_path: str, 
+    outputs: List[Tuple[str, str, Dict]], 
+    width: Optional[int] = None, 
+    height: Optional[int] = None, 
+    grayscale: bool = False,
+    resize_filter: Optional[str] = None,
+    backend: str = 'pil'
+) -> int:
+    """
+    Decode an image once and save it to one or more outputs.
+    
+    Args:
+        input_path: Path to the input image
+        outputs: List of (output path, PIL format name, save options from get_save_kwargs())
+        width: Output width (optional)
+        height: Output height (optional)
+        grayscale: Convert to grayscale
+        resize_filter: Resize filter name (optional, picked automatically)
+        backend: 'pil' or 'vips' (anything libvips can't read or write uses PIL)
         
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    Returns:
+        int: Number of outputs saved successfully
+    """
+    # Jobs libvips can't do exactly as asked (a chosen filter, PNG optimize) stay on PIL
+    vips_ok = (
+        backend == 'vips' 
+        and not resize_filter 
+        and all(fmt in VIPS_SAVERS and 'optimize' not in kwargs for _, fmt, kwargs in outputs)
+    )
+    if vips_ok:
+        saved = convert_image_vips(input_path, outputs, width, height, grayscale)
+        if saved is not None:
+            return saved
+    
+    pooled = None
+    try:
+        # Load the image through a large read buffer; decoders such as PNG and
+        # TIFF read the stream in small pieces
+        with open(input_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            img = Image.open(f)
+            
+            # Work out the target size (only the header has been read so far)
+            if width or height:
+                width, height = calculate_size(img.size[0], img.size[1], width, height)
+            
+            # Let libjpeg do part of the work while decoding: downscale in the DCT
+            # domain (keeping about twice the target size so the resize filter still
+            # has data to work with) and, for grayscale, decode only the luma channel
+            if img.format == 'JPEG' and (width or height or grayscale):
+                draft_size = (width * 2, height * 2) if width or height else None
+                img.draft('L' if grayscale else 'RGB', draft_size)
+            
+            # Decode now, before the file is closed
+            img.load()
         
-        # Save the image
-        save_kwargs = {}
-        if output_format in ['JPEG', 'WEBP']:
-            save_kwargs['quality'] = quality
-        if output_format == 'PNG':
-            save_kwargs['optimize'] = True
+        # Color mode conversion if needed
+        if grayscale:
+            if img.mode != 'L':
+                img = img.convert('L')
+        elif img.mode == 'RGBA' and all(fmt == 'JPEG' for _, fmt, _ in outputs):
+            # JPEG doesn't support transparency, drop the alpha channel into a pooled
+            # RGB buffer (paste overwrites every pixel, so it needs no clearing)
+            pooled = _acquire_image('RGB', img.size)
+            pooled.paste(img)
+            img = pooled
         
-        img.save(output_path, format=output_format, **save_kwargs)
-        return True
+        # Resize if needed (a resize to the same size would still run the full filter)
+        if (width or height) and (width, height) != img.size:
+            if resize_filter:
+                resample = RESIZE_FILTERS[resize_filter]
+            else:
+                # LANCZOS only pays off when shrinking; BICUBIC looks the same when enlarging
+                scale = max(width / img.size[0], height / img.size[1])
+                resample = Image.LANCZOS if scale < 1.0 else Image.BICUBIC
+            
+            img = img.resize((width, height), resample)
+        
+        # Save the image in every requested format, reusing the decoded pixels
+        saved = 0
+        for output_path, output_format, save_kwargs in outputs:
+            if save_image(img, output_path, output_format, save_kwargs):
+                saved += 1
+        return saved
     
     except Exception as e:
         print(f"{Fore.RED}Error processing image ({input_path}): {e}")
-        return False
+        return 0
+    
+    finally:
+        if pooled is not None:
+            _release_image(pooled)
+
+def process_image(
+    input_path: str, 
+    output_path: str, 
+    output_format: str, 
+    quality: int = 90, 
+    width: Optional[int] = None, 
+    height: Optional[int] = None, 
+    grayscale: bool = False,
+    optimize: bool = False,
+    compress_level: int = 6,
+    resize_filter: Optional[str] = None,
+    backend: str = 'pil'
+) -> bool:
+    """
+    Process an image with the given parameters.
+    
+    Args:
+        input_path: Path to the input image
+        output_path: Path to save the output image (its directory must already exist)
+        output_format: Output format (PIL format name)
+        quality: Image quality (1-100)
+        width: Output width (optional)
+        height: Output height (optional)
+        grayscale: Convert to grayscale
+        optimize: Search for the smallest PNG encoding
+        compress_level: PNG compression level (0-9)
+        resize_filter: Resize filter name (optional, picked automatically)
+        backend: 'pil' or 'vips'
+        
+    Returns:
+        bool: Whether the conversion was successful
+    """
+    save_kwargs = get_save_kwargs(output_format, quality, optimize, compress_level)
+    return convert_image(
+        input_path, 
+        [(output_path, output_format, save_kwargs)], 
+        width, 
+        height, 
+        grayscale, 
+        resize_filter, 
+        backend
+    ) == 1
+
+def _process_one(task: Tuple) -> int:
+    """Unpack a task tuple and convert it (used by the worker pool)."""
+    return convert_image(*task)
 
 def find_image_files(directory: str, recursive: bool = False) -> List[str]:
     """
@@ -175,30 +556,33 @@ def find_image_files(directory: str, recursive: bool = False) -> List[str]:
     Returns:
         List[str]: List of found image files
     """
-    image_files = []
-    valid_extensions = tuple(f".{ext}" for ext in SUPPORTED_FORMATS.keys())
-    
-    if recursive:
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith(valid_extensions):
-                    image_files.append(os.path.join(root, file))
-    else:
-        for file in os.listdir(directory):
-            if file.lower().endswith(valid_extensions):
-                image_files.append(os.path.join(directory, file))
+    # DirEntry caches the file type, so no extra stat call per file
+    def scan(path: str) -> Iterator[str]:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from scan(entry.path)
+                elif entry.is_file():
+                    _, dot, ext = entry.name.rpartition('.')
+                    if dot and ext.lower() in IMAGE_EXTENSIONS:
+                        yield entry.path
     
-    return image_files
+    return list(scan(directory))
 
 def process_directory(
     input_dir: str, 
     output_dir: str, 
-    output_format: str, 
+    output_format: Union[str, List[str]], 
     quality: int = 90, 
     width: Optional[int] = None, 
     height: Optional[int] = None, 
     recursive: bool = False, 
-    grayscale: bool = False
+    grayscale: bool = False,
+    optimize: bool = False,
+    compress_level: int = 6,
+    resize_filter: Optional[str] = None,
+    backend: str = 'pil'
 ) -> Tuple[int, int]:
     """
     Process a directory with the given parameters.
@@ -206,15 +590,21 @@ def process_directory(
     Args:
         input_dir: Input directory
         output_dir: Output directory
-        output_format: Output format
+        output_format: Output format, or a list of formats (each one is saved
+            to its own subdirectory, e.g. output_dir/png/)
         quality: Image quality
         width: Output width
         height: Output height
         recursive: Search recursively in subdirectories
         grayscale: Convert to grayscale
+        optimize: Search for the smallest PNG encoding
+        compress_level: PNG compression level
+        resize_filter: Resize filter name
+        backend: 'pil' or 'vips'
         
     Returns:
-        Tuple[int, int]: (number of successful conversions, total number of files)
+        Tuple[int, int]: (number of successful conversions, total number of conversions,
+        not counting inputs skipped because another file already takes their output name)
     """
     # Find image files
     image_files = find_image_files(input_dir, recursive)
@@ -223,38 +613,103 @@ def process_directory(
         print(f"{Fore.YELLOW}No image files found in the specified directory.")
         return 0, 0
     
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    # Output formats (duplicates such as jpg/jpeg collapse into one)
+    if isinstance(output_format, str):
+        output_formats = [output_format]
+    else:
+        output_formats = list(dict.fromkeys(output_format))
+    
+    # Build the task list up front so the output paths are worked out in the parent
+    input_root = Path(input_dir)
+    output_root = Path(output_dir)
+    
+    # (output root, file suffix, format, save options) for every format, worked out
+    # once for the whole batch; with several formats each one gets its own subdirectory
+    targets = []
+    for fmt in output_formats:
+        ext = _FORMAT_TO_EXT.get(fmt, 'jpg')
+        root = output_root / ext if len(output_formats) > 1 else output_root
+        save_kwargs = get_save_kwargs(fmt, quality, optimize, compress_level)
+        targets.append((root, f".{ext}", fmt, save_kwargs))
+    
+    # Output directories for each input directory (many files share a parent)
+    output_parents: Dict[Path, List[Path]] = {}
+    
+    # Plan every file into parallel lists: inputs, their outputs and their sizes
+    inputs: List[str] = []
+    outputs: List[List[Tuple[str, str, Dict]]] = []
+    sizes: List[int] = []
+    
+    # Output paths already taken; files sharing a name (e.g. photo.jpg and photo.png)
+    # would otherwise be written to the same file by different workers
+    claimed = set()
+    skipped_count = 0
     
-    # Format extension
-    ext = next((k for k, v in SUPPORTED_FORMATS.items() if v == output_format), 'jpg')
+    # Sorted, so which of the clashing files gets converted doesn't depend on scan order
+    for input_path in sorted(image_files):
+        path = Path(input_path)
+        parents = output_parents.get(path.parent)
+        if parents is None:
+            # Mirror the subdirectory layout (non-recursive scans only ever hit input_root)
+            rel_dir = path.parent.relative_to(input_root)
+            parents = [root / rel_dir for root, _, _, _ in targets]
+            output_parents[path.parent] = parents
+        
+        file_outputs = [
+            (str(parent / (path.stem + suffix)), fmt, save_kwargs)
+            for parent, (_, suffix, fmt, save_kwargs) in zip(parents, targets)
+        ]
+        
+        # All outputs of a file share its directory and name, so checking the first is enough
+        first_output = file_outputs[0][0]
+        if first_output in claimed:
+            skipped_count += 1
+            continue
+        claimed.add(first_output)
+        
+        inputs.append(input_path)
+        outputs.append(file_outputs)
+        try:
+            sizes.append(os.stat(input_path).st_size)
+        except OSError:
+            # Unreadable files fail (and get reported) when they are processed
+            sizes.append(0)
+    
+    # Largest files first, so the pool doesn't end up waiting on one big image at the end
+    order = sorted(range(len(inputs)), key=sizes.__getitem__, reverse=True)
+    tasks = [
+        (inputs[i], outputs[i], width, height, grayscale, resize_filter, backend)
+        for i in order
+    ]
+    
+    if skipped_count:
+        print(f"{Fore.YELLOW}{skipped_count} input(s) skipped because their output name is already taken.")
+    
+    # Create every output directory once, instead of once per image
+    for parents in output_parents.values():
+        for out_dir in parents:
+            try:
+                os.makedirs(out_dir, exist_ok=True)
+            except OSError as e:
+                # The images meant for it fail (and get reported) when they are saved
+                print(f"{Fore.RED}Error creating output directory ({out_dir}): {e}")
     
-    # Processing
+    # Processing (every image is independent, so spread them over all cores)
     success_count = 0
     
     print(f"{Fore.CYAN}Processing images...")
-    for input_path in tqdm(image_files, unit="image"):
-        # Calculate relative path for output file
-        if recursive:
-            rel_path = os.path.relpath(input_path, input_dir)
-            rel_dir = os.path.dirname(rel_path)
-            filename = os.path.splitext(os.path.basename(input_path))[0]
-            
-            # Create output directory if in recursive mode
-            if rel_dir:
-                os.makedirs(os.path.join(output_dir, rel_dir), exist_ok=True)
-                output_path = os.path.join(output_dir, rel_dir, f"{filename}.{ext}")
-            else:
-                output_path = os.path.join(output_dir, f"{filename}.{ext}")
-        else:
-            filename = os.path.splitext(os.path.basename(input_path))[0]
-            output_path = os.path.join(output_dir, f"{filename}.{ext}")
-        
-        # Process image
-        if process_image(input_path, output_path, output_format, quality, width, height, grayscale):
-            success_count += 1
+    # The parent may already have loaded libvips (main() imports it to check that it
+    # works, and library callers may have converted images with it), and libvips
+    # isn't safe to fork once it's running, so give the workers fresh processes
+    mp_context = multiprocessing.get_context('spawn') if backend == 'vips' else None
+    # The default worker count is one per core (capped at 61 on Windows)
+    with ProcessPoolExecutor(mp_context=mp_context) as executor:
+        # One task at a time, so each free worker picks up the next largest file
+        results = executor.map(_process_one, tasks)
+        for saved in tqdm(results, total=len(tasks), unit="image"):
+            success_count += saved
     
-    return success_count, len(image_files)
+    return success_count, len(tasks) * len(output_formats)
 
 def main():
     """Main program."""
@@ -264,6 +719,20 @@ def main():
     # Parse arguments
     args = parse_arguments()
     
+    if args.backend == 'vips':
+        # Import for real: this also fails when pyvips is installed but libvips isn't
+        try:
+            import pyvips
+        except (ImportError, OSError) as e:
+            print(f"{Fore.RED}Error: The vips backend needs pyvips and libvips ({e}). "
+                  f"Please install them with: pip install pyvips[binary]")
+            return
+    
+    # libvips always resizes with its own LANCZOS3 thumbnailer and has no PNG optimize pass
+    if args.backend == 'vips' and (args.filter or args.optimize):
+        print(f"{Fore.RED}Error: --filter and --optimize can't be used with the vips backend.")
+        return
+    
     start_time = time.time()
     
     # Process single image or directory
@@ -273,20 +742,36 @@ def main():
             print(f"{Fore.RED}Error: The specified input file does not exist.")
             return
         
-        output_format = get_output_format(args.output, args.type)
+        if args.type and len(args.type) > 1:
+            print(f"{Fore.RED}Error: Only one output format can be used when converting a single image.")
+            return
+        
+        output_format = get_output_format(args.output, args.type[0] if args.type else None)
         
         print(f"{Fore.CYAN}Processing image: {Fore.WHITE}{args.input}")
         print(f"{Fore.CYAN}Output format: {Fore.WHITE}{output_format}")
         
-        if process_image(
-            args.input, 
-            args.output, 
-            output_format, 
-            args.quality, 
-            args.width, 
-            args.height, 
-            args.grayscale
-        ):
+        # Create output directory if it doesn't exist
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+            converted = process_image(
+                args.input, 
+                args.output, 
+                output_format, 
+                args.quality, 
+                args.width, 
+                args.height, 
+                args.grayscale,
+                args.optimize,
+                args.compress_level,
+                args.filter,
+                args.backend
+            )
+        except OSError as e:
+            print(f"{Fore.RED}Error processing image ({args.input}): {e}")
+            converted = False
+        
+        if converted:
             print(f"{Fore.GREEN}Image successfully converted: {Fore.WHITE}{args.output}")
         else:
             print(f"{Fore.RED}An error occurred while converting the image.")
@@ -301,22 +786,26 @@ def main():
             print(f"{Fore.RED}Error: Output format must be specified (-t/--type) when processing a directory.")
             return
         
-        output_format = SUPPORTED_FORMATS[args.type.lower()]
+        output_formats = list(dict.fromkeys(SUPPORTED_FORMATS[t] for t in args.type))
         
         print(f"{Fore.CYAN}Processing directory: {Fore.WHITE}{args.directory}")
         print(f"{Fore.CYAN}Output directory: {Fore.WHITE}{args.output}")
-        print(f"{Fore.CYAN}Output format: {Fore.WHITE}{output_format}")
+        print(f"{Fore.CYAN}Output format: {Fore.WHITE}{', '.join(output_formats)}")
         print(f"{Fore.CYAN}Recursive mode: {Fore.WHITE}{'Yes' if args.recursive else 'No'}")
         
         success_count, total_count = process_directory(
             args.directory, 
             args.output, 
-            output_format, 
+            output_formats, 
             args.quality, 
             args.width, 
             args.height, 
             args.recursive, 
-            args.grayscale
+            args.grayscale,
+            args.optimize,
+            args.compress_level,
+            args.filter,
+            args.backend
         )
         
         if total_count == 0: